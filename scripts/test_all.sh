@@ -1,15 +1,28 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
-echo "==> Formatting check"
-cargo fmt --all -- --check || true
+# Reuse compiled artifacts across runs when sccache is available
+if [ -z "${RUSTC_WRAPPER:-}" ] && command -v sccache >/dev/null 2>&1; then
+  export RUSTC_WRAPPER=sccache
+  echo "==> Using sccache for rustc"
+fi
 
-echo "==> Lint (all targets, all features)"
-cargo clippy --all-targets --all-features -- -D warnings || true
+# Run a named step and report how long it took
+step() {
+  local name="$1"; shift
+  local start=$SECONDS status=0
+  echo "==> $name"
+  "$@" || status=$?
+  echo "    $name: $((SECONDS - start))s (exit $status)"
+  return "$status"
+}
 
-echo "==> Run CLI tests (no GUI feature)"
-cargo test --all --no-default-features
+step "Formatting check" cargo fmt --all -- --check || true
+
+step "Lint (all targets, all features)" cargo clippy --all-targets --all-features -- -D warnings || true
+
+step "Run CLI tests (no GUI feature)" cargo test --all --no-default-features
 
 echo "==> Skipping GUI build/tests (GUI removed)"
 
-echo "==> Done"
+echo "==> Done in ${SECONDS}s"